@@ -5,9 +5,30 @@ Creates the complete directory structure and template Jupyter notebooks
 """
 
 import os
+import sys
 import json
+import hashlib
+import logging
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+    # One reused encoder instance amortizes setup cost across calls
+    _msgspec_encoder = msgspec.json.Encoder()
+except ImportError:
+    _msgspec_encoder = None
+
+# Buffered logging keeps scaffold progress messages from serializing the
+# writer threads on a line-buffered TTY the way bare print() calls would
+log = logging.getLogger(__name__)
+
 # Base directory
 BASE_DIR = Path("/workspaces/MIT-OCW-18.01---Calculus-1_with-OpenStax-Calculus-Volume-1")
 
@@ -80,6 +101,174 @@ PROBLEM_SETS = [
     {"num": 9, "lectures": [32, 33, 34]},
 ]
 
+# Pre-compute display names once at import so the write loops do no
+# repeated replace/title string transforms
+for _unit_data in COURSE_STRUCTURE.values():
+    for _lecture in _unit_data["lectures"]:
+        _lecture["pretty"] = _lecture["title"].replace("-", " ").title()
+
+_EXAM_PRETTY = {
+    name: name.replace("-", " ").title()
+    for name in [u["exam"] for u in COURSE_STRUCTURE.values()] + ["final-exam"]
+}
+
+# Flattened structure-of-arrays view of the lectures: parallel tuples are
+# denser to iterate than the nested dict-of-dicts-of-lists layout above,
+# and give every lecture a single flat index
+_LECTURE_UNITS, _LECTURE_NUMS, _LECTURE_TITLES, _LECTURE_PRETTY, _LECTURE_OPENSTAX = (
+    tuple(column) for column in zip(*[
+        (unit_name, lecture["num"], lecture["title"], lecture["pretty"],
+         tuple(lecture["openstax"]))
+        for unit_name, unit_data in COURSE_STRUCTURE.items()
+        for lecture in unit_data["lectures"]
+    ])
+)
+
+# Directories already created this run; lets us skip redundant mkdir syscalls
+_created = set()
+
+def ensure_dir(path):
+    """Create a directory (with parents) unless we already know it exists"""
+    path = str(path)
+    if path in _created:
+        return
+    os.makedirs(path, exist_ok=True)
+    while path and path not in _created:
+        _created.add(path)
+        path = os.path.dirname(path)
+
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+def _write_bytes(path, data):
+    """Write data in a single os.write on a raw fd, bypassing the io stack"""
+    fd = os.open(path, _OPEN_FLAGS, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+def _dumps(obj):
+    """Compact JSON encode to bytes, preferring msgspec then orjson
+
+    Output is deliberately un-indented: pretty-printing forces the slow
+    pure-Python encoder path in stdlib json, and Jupyter loads compact and
+    indented notebooks identically.
+    """
+    if _msgspec_encoder is not None:
+        return _msgspec_encoder.encode(obj)
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # ensure_ascii=False skips the unicode-escape scan and, with compact
+    # separators, keeps stdlib json on its C-accelerated encoder path
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+# Setup cell source shared by every generated notebook, hoisted to module
+# scope so the literal is built once instead of per call
+_SETUP_SOURCE = (
+    "import numpy as np\n",
+    "import matplotlib.pyplot as plt\n",
+    "import sympy as sp\n",
+    "from sympy import *\n",
+    "import sys\n",
+    "sys.path.append('../../utils')\n",
+    "from calculus_utils import *\n",
+    "from plotting_utils import *\n",
+    "\n",
+    "# Initialize pretty printing\n",
+    "sp.init_printing(use_latex='mathjax')\n",
+    "\n",
+    "# Matplotlib settings\n",
+    "plt.style.use('seaborn-v0_8-darkgrid')\n",
+    "plt.rcParams['figure.figsize'] = (10, 6)\n"
+)
+
+# Static cells appended after the Setup cell for each notebook type.  The
+# dicts are shared across calls; serialization never mutates them.
+_TYPE_CELLS = {
+    "dashboard": [
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Learning Objectives\n", "\n", "1. [Add objective here]\n"]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Prerequisites\n", "\n", "- [ ] [Add prerequisite here]\n"]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Resources\n", "\n", "- [Link to resource]\n"]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Progress Tracker\n", "\n", "- [ ] Lecture notes reviewed\n", "- [ ] Textbook sections completed\n", "- [ ] Problems attempted\n"]
+        }
+    ],
+    "lecture": [
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Lecture Content\n", "\n", "[Lecture notes will go here]\n"]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Key Concepts\n"]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Examples\n"]
+        }
+    ],
+    "textbook": [
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Definitions\n"]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Theorems\n"]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Worked Examples\n"]
+        },
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Exercises\n"]
+        }
+    ],
+    "problems": [
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["## Problem 1\n", "\n", "### Problem Statement\n", "\n", "### Concepts Being Tested\n", "\n", "### Solution Strategy\n", "\n", "### Detailed Solution\n", "\n", "### Alternative Approaches\n", "\n", "### Common Mistakes\n", "\n", "### Verification\n"]
+        }
+    ],
+}
+
+# Metadata shared by every generated notebook; serialized once into the
+# trailing bytes spliced onto each template
+_NB_METADATA = {
+    "kernelspec": {
+        "display_name": "Python 3",
+        "language": "python",
+        "name": "python3"
+    },
+    "language_info": {
+        "name": "python",
+        "version": "3.10.0"
+    }
+}
+
 def create_notebook_template(title, notebook_type, description=""):
     """Create a Jupyter notebook template with proper structure"""
     cells = [
@@ -98,369 +287,350 @@ def create_notebook_template(title, notebook_type, description=""):
             "execution_count": None,
             "metadata": {},
             "outputs": [],
-            "source": [
-                "import numpy as np\n",
-                "import matplotlib.pyplot as plt\n",
-                "import sympy as sp\n",
-                "from sympy import *\n",
-                "import sys\n",
-                "sys.path.append('../../utils')\n",
-                "from calculus_utils import *\n",
-                "from plotting_utils import *\n",
-                "\n",
-                "# Initialize pretty printing\n",
-                "sp.init_printing(use_latex='mathjax')\n",
-                "\n",
-                "# Matplotlib settings\n",
-                "plt.style.use('seaborn-v0_8-darkgrid')\n",
-                "plt.rcParams['figure.figsize'] = (10, 6)\n"
-            ]
+            "source": list(_SETUP_SOURCE)
         }
     ]
-    
-    if notebook_type == "dashboard":
-        cells.extend([
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Learning Objectives\n", "\n", "1. [Add objective here]\n"]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Prerequisites\n", "\n", "- [ ] [Add prerequisite here]\n"]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Resources\n", "\n", "- [Link to resource]\n"]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Progress Tracker\n", "\n", "- [ ] Lecture notes reviewed\n", "- [ ] Textbook sections completed\n", "- [ ] Problems attempted\n"]
-            }
-        ])
-    elif notebook_type == "lecture":
-        cells.extend([
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Lecture Content\n", "\n", "[Lecture notes will go here]\n"]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Key Concepts\n"]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Examples\n"]
-            }
-        ])
-    elif notebook_type == "textbook":
-        cells.extend([
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Definitions\n"]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Theorems\n"]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Worked Examples\n"]
-            },
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Exercises\n"]
-            }
-        ])
-    elif notebook_type == "problems":
-        cells.extend([
-            {
-                "cell_type": "markdown",
-                "metadata": {},
-                "source": ["## Problem 1\n", "\n", "### Problem Statement\n", "\n", "### Concepts Being Tested\n", "\n", "### Solution Strategy\n", "\n", "### Detailed Solution\n", "\n", "### Alternative Approaches\n", "\n", "### Common Mistakes\n", "\n", "### Verification\n"]
-            }
-        ])
+    cells.extend(_TYPE_CELLS.get(notebook_type, []))
     
     notebook = {
         "cells": cells,
-        "metadata": {
-            "kernelspec": {
-                "display_name": "Python 3",
-                "language": "python",
-                "name": "python3"
-            },
-            "language_info": {
-                "name": "python",
-                "version": "3.10.0"
-            }
-        },
+        "metadata": _NB_METADATA,
         "nbformat": 4,
         "nbformat_minor": 4
     }
     
     return notebook
 
-def create_lecture_folder(unit_path, lecture_info):
-    """Create a complete lecture folder with all notebooks"""
-    lecture_num = lecture_info["num"]
-    lecture_title = lecture_info["title"]
-    openstax_sections = lecture_info["openstax"]
+def _json_escape(s):
+    """Escape a string for splicing into a JSON string literal"""
+    return json.dumps(s)[1:-1]
+
+_NB_TAIL = b',"metadata":' + _dumps(_NB_METADATA) + b',"nbformat":4,"nbformat_minor":4}'
+
+def _format_template(notebook_type):
+    """Serialize one notebook type into a str.format template with
+    {title_json}/{desc_json} placeholders"""
+    cells = create_notebook_template("__TITLE__", notebook_type, "__DESC__")["cells"]
+    blob = (b'{"cells":' + _dumps(cells) + _NB_TAIL).decode()
+    # Escape JSON braces so .format only sees our two placeholders
+    blob = blob.replace("{", "{{").replace("}", "}}")
+    return (blob.replace("__TITLE__", "{title_json}")
+                .replace("__DESC__", "{desc_json}"))
+
+# Notebook JSON templates, one per type, built once at import.  Per file the
+# render is a single .format interpolating the escaped title/description.
+TEMPLATES = {
+    t: _format_template(t)
+    for t in ("dashboard", "lecture", "textbook", "problems", "activity")
+}
+
+def render_notebook(title, notebook_type, description=""):
+    """Render a notebook from its JSON template"""
+    return TEMPLATES[notebook_type].format(
+        title_json=_json_escape(title),
+        desc_json=_json_escape(description)).encode()
+
+def create_lecture_folder(unit_path, index):
+    """Plan (path, title, type, description) records for the lecture at
+    `index` in the flattened lecture arrays"""
+    lecture_num = _LECTURE_NUMS[index]
+    lecture_title = _LECTURE_TITLES[index]
+    lecture_pretty = _LECTURE_PRETTY[index]
+    openstax_sections = _LECTURE_OPENSTAX[index]
     
-    lecture_folder = unit_path / f"lecture-{lecture_num:02d}-{lecture_title}"
-    lecture_folder.mkdir(parents=True, exist_ok=True)
+    lecture_folder = os.path.join(str(unit_path), f"lecture-{lecture_num:02d}-{lecture_title}")
+    records = []
     
-    print(f"  Creating Lecture {lecture_num}: {lecture_title}")
+    log.info(f"  Creating Lecture {lecture_num}: {lecture_title}")
     
     # 1. Overview Master Dashboard
-    nb = create_notebook_template(
-        f"Lecture {lecture_num}: {lecture_title.replace('-', ' ').title()} - Overview",
+    records.append((
+        os.path.join(lecture_folder, "01_Overview_Master_Dashboard.ipynb"),
+        f"Lecture {lecture_num}: {lecture_pretty} - Overview",
         "dashboard",
         f"Master dashboard for tracking progress through Lecture {lecture_num}"
-    )
-    with open(lecture_folder / "01_Overview_Master_Dashboard.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     
     # 2. MIT Lecture Notes
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(lecture_folder, "02_Lecture_Notes_MIT.ipynb"),
         f"Lecture {lecture_num}: MIT Lecture Notes",
         "lecture",
         "Complete lecture notes from MIT OCW with examples and insights"
-    )
-    with open(lecture_folder / "02_Lecture_Notes_MIT.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     
     # 3-N. OpenStax Chapter Sections
     file_num = 3
     for section in openstax_sections:
-        nb = create_notebook_template(
+        section_safe = section.replace(".", "-")
+        records.append((
+            os.path.join(lecture_folder, f"{file_num:02d}_OpenStax_Ch{section_safe}.ipynb"),
             f"OpenStax Section {section}",
             "textbook",
             f"Comprehensive coverage of OpenStax Calculus Volume 1, Section {section}"
-        )
-        section_safe = section.replace(".", "-")
-        with open(lecture_folder / f"{file_num:02d}_OpenStax_Ch{section_safe}.ipynb", "w") as f:
-            json.dump(nb, f, indent=2)
+        ))
         file_num += 1
-    
+
     # Problem Set Activities (if this lecture has associated problems)
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(lecture_folder, f"{file_num:02d}_Problem_Set_Activities.ipynb"),
         f"Lecture {lecture_num}: Problem Set Activities",
         "problems",
         "Selected problems from problem sets with detailed solutions"
-    )
-    with open(lecture_folder / f"{file_num:02d}_Problem_Set_Activities.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     file_num += 1
     
     # Flashcards
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(lecture_folder, f"{file_num:02d}_Activity_Flashcards.ipynb"),
         f"Lecture {lecture_num}: Flashcards",
         "activity",
         "Interactive flashcards for active recall and spaced repetition"
-    )
-    with open(lecture_folder / f"{file_num:02d}_Activity_Flashcards.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     file_num += 1
     
     # Interactive Playground
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(lecture_folder, f"{file_num:02d}_Activity_Interactive_Playground.ipynb"),
         f"Lecture {lecture_num}: Interactive Playground",
         "activity",
         "Interactive visualizations and explorations of key concepts"
-    )
-    with open(lecture_folder / f"{file_num:02d}_Activity_Interactive_Playground.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     file_num += 1
     
     # Exercise Bank
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(lecture_folder, f"{file_num:02d}_Activity_Exercise_Bank.ipynb"),
         f"Lecture {lecture_num}: Exercise Bank",
         "problems",
         "Additional practice problems with varying difficulty levels"
-    )
-    with open(lecture_folder / f"{file_num:02d}_Activity_Exercise_Bank.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     file_num += 1
     
     # AI Q&A Journal
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(lecture_folder, f"{file_num:02d}_Log_AI_QA_Journal.ipynb"),
         f"Lecture {lecture_num}: AI Q&A Journal",
         "activity",
         "Questions, insights, and connections discovered during study"
-    )
-    with open(lecture_folder / f"{file_num:02d}_Log_AI_QA_Journal.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
+
+    return records
 
 def create_problem_set_folder(ps_folder, ps_info):
-    """Create a problem set folder with detailed solution notebooks"""
+    """Plan (path, title, type, description) records for a problem set folder"""
     ps_num = ps_info["num"]
-    ps_path = ps_folder / f"ps{ps_num:02d}"
-    ps_path.mkdir(parents=True, exist_ok=True)
+    ps_path = os.path.join(str(ps_folder), f"ps{ps_num:02d}")
+    records = []
     
-    print(f"  Creating Problem Set {ps_num}")
+    log.info(f"  Creating Problem Set {ps_num}")
     
     # Overview
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(ps_path, "00_Overview.ipynb"),
         f"Problem Set {ps_num}: Overview",
         "dashboard",
         f"Problem set {ps_num} covering lectures {ps_info['lectures']}"
-    )
-    with open(ps_path / "00_Overview.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     
     # Problems 1-5 (Part 1)
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(ps_path, "01_Problems_1-5_Detailed.ipynb"),
         f"Problem Set {ps_num}: Problems 1-5",
         "problems",
         "Detailed solutions for problems 1-5 with full explanations"
-    )
-    with open(ps_path / "01_Problems_1-5_Detailed.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     
     # Problems 6-10 (Part 2)
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(ps_path, "02_Problems_6-10_Detailed.ipynb"),
         f"Problem Set {ps_num}: Problems 6-10",
         "problems",
         "Detailed solutions for problems 6-10 with full explanations"
-    )
-    with open(ps_path / "02_Problems_6-10_Detailed.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     
     # Complete Solutions
-    nb = create_notebook_template(
+    records.append((
+        os.path.join(ps_path, "03_Solutions_Complete.ipynb"),
         f"Problem Set {ps_num}: Complete Solutions",
         "problems",
         "Comprehensive solutions reference for all problems"
-    )
-    with open(ps_path / "03_Solutions_Complete.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
+
+    return records
 
 def create_exam_folder(exam_folder, exam_name):
-    """Create an exam folder with practice and solutions"""
-    exam_path = exam_folder / exam_name
-    exam_path.mkdir(parents=True, exist_ok=True)
+    """Plan (path, title, type, description) records for an exam folder"""
+    exam_path = os.path.join(str(exam_folder), exam_name)
+    records = []
     
-    print(f"  Creating {exam_name}")
+    log.info(f"  Creating {exam_name}")
     
     # Practice Exam
-    nb = create_notebook_template(
-        f"{exam_name.replace('-', ' ').title()}: Practice Exam",
+    records.append((
+        os.path.join(exam_path, "01_Practice_Exam.ipynb"),
+        f"{_EXAM_PRETTY[exam_name]}: Practice Exam",
         "problems",
         "Practice problems in exam format"
-    )
-    with open(exam_path / "01_Practice_Exam.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     
     # Solutions Part 1
-    nb = create_notebook_template(
-        f"{exam_name.replace('-', ' ').title()}: Solutions Part 1",
+    records.append((
+        os.path.join(exam_path, "02_Solutions_Part1.ipynb"),
+        f"{_EXAM_PRETTY[exam_name]}: Solutions Part 1",
         "problems",
         "Detailed solutions for first half of exam"
-    )
-    with open(exam_path / "02_Solutions_Part1.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     
     # Solutions Part 2
-    nb = create_notebook_template(
-        f"{exam_name.replace('-', ' ').title()}: Solutions Part 2",
+    records.append((
+        os.path.join(exam_path, "03_Solutions_Part2.ipynb"),
+        f"{_EXAM_PRETTY[exam_name]}: Solutions Part 2",
         "problems",
         "Detailed solutions for second half of exam"
-    )
-    with open(exam_path / "03_Solutions_Part2.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
     
     # Review Guide
-    nb = create_notebook_template(
-        f"{exam_name.replace('-', ' ').title()}: Review Guide",
+    records.append((
+        os.path.join(exam_path, "04_Review_Guide.ipynb"),
+        f"{_EXAM_PRETTY[exam_name]}: Review Guide",
         "dashboard",
         "Comprehensive review guide and study strategies"
-    )
-    with open(exam_path / "04_Review_Guide.ipynb", "w") as f:
-        json.dump(nb, f, indent=2)
+    ))
 
-def main():
-    """Main scaffolding generation function"""
-    print("=" * 60)
-    print("MIT OCW 18.01 Calculus Repository Scaffolding Generator")
-    print("=" * 60)
-    print()
-    
-    # Create utils directory
-    print("Creating utilities directory...")
-    utils_dir = BASE_DIR / "utils"
-    utils_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create units and lectures
-    print("\nCreating unit and lecture structure...")
-    for unit_name, unit_data in COURSE_STRUCTURE.items():
-        print(f"\n{unit_name.upper()}")
-        unit_path = BASE_DIR / unit_name
-        unit_path.mkdir(parents=True, exist_ok=True)
-        
-        # Create lectures
-        for lecture_info in unit_data["lectures"]:
-            create_lecture_folder(unit_path, lecture_info)
-    
-    # Create problem sets
-    print("\n\nCreating problem set structure...")
-    print("PROBLEM-SETS")
-    ps_folder = BASE_DIR / "problem-sets"
-    ps_folder.mkdir(parents=True, exist_ok=True)
-    
+    return records
+
+def plan():
+    """Enumerate every file to generate as flat (path, title, type, description) records"""
+    records = []
+    base_dir = str(BASE_DIR)
+    
+    # Units and lectures, driven by the flat lecture arrays
+    log.info("\nCreating unit and lecture structure...")
+    current_unit = None
+    for index, unit_name in enumerate(_LECTURE_UNITS):
+        if unit_name != current_unit:
+            current_unit = unit_name
+            log.info(f"\n{unit_name.upper()}")
+            records.append((
+                os.path.join(base_dir, unit_name, "README.md"),
+                unit_name.replace('-', ' ').title(),
+                "readme",
+                "This unit contains lecture folders with comprehensive materials."
+            ))
+        records.extend(create_lecture_folder(os.path.join(base_dir, unit_name), index))
+    
+    # Problem sets
+    log.info("\n\nCreating problem set structure...")
+    log.info("PROBLEM-SETS")
+    ps_folder = os.path.join(base_dir, "problem-sets")
     for ps_info in PROBLEM_SETS:
-        create_problem_set_folder(ps_folder, ps_info)
+        records.extend(create_problem_set_folder(ps_folder, ps_info))
     
-    # Create exams
-    print("\n\nCreating exam structure...")
-    print("EXAMS")
-    exam_folder = BASE_DIR / "exams"
-    exam_folder.mkdir(parents=True, exist_ok=True)
+    # Exams
+    log.info("\n\nCreating exam structure...")
+    log.info("EXAMS")
+    exam_folder = os.path.join(base_dir, "exams")
+    for unit_data in COURSE_STRUCTURE.values():
+        records.extend(create_exam_folder(exam_folder, unit_data["exam"]))
+    records.extend(create_exam_folder(exam_folder, "final-exam"))
     
-    for unit_name, unit_data in COURSE_STRUCTURE.items():
-        create_exam_folder(exam_folder, unit_data["exam"])
+    return records
+
+def _render(record):
+    """Render one planned record to bytes"""
+    path, title, record_type, description = record
+    if record_type == "readme":
+        return f"# {title}\n\n{description}\n".encode()
+    return render_notebook(title, record_type, description)
+
+def execute(records, zip_output=False):
+    """Render every planned record and write the files"""
+    base_dir = str(BASE_DIR)
+    pairs = [(record[0], _render(record)) for record in records]
+    
+    log.info("\n\nWriting files...")
+    if zip_output:
+        with zipfile.ZipFile(BASE_DIR / "scaffold.zip", "w",
+                             compression=zipfile.ZIP_STORED) as zf:
+            for path, data in pairs:
+                zf.writestr(os.path.relpath(path, base_dir).replace(os.sep, "/"), data)
+        return
+    
+    # Skip files whose content hash matches the previous run, so a
+    # re-run over an existing scaffold does no filesystem mutations
+    hash_file = os.path.join(base_dir, ".scaffold_hashes.json")
+    try:
+        # Single read_bytes + loads mirrors the single-write_bytes pattern on
+        # the encode side: one syscall instead of chunked file-object reads
+        old_hashes = json.loads(Path(hash_file).read_bytes())
+    except (OSError, ValueError):
+        old_hashes = {}
+    new_hashes = {}
+    to_write = []
+    for path, data in pairs:
+        rel = os.path.relpath(path, base_dir).replace(os.sep, "/")
+        digest = hashlib.sha1(data).hexdigest()
+        new_hashes[rel] = digest
+        if old_hashes.get(rel) == digest and os.path.exists(path):
+            continue
+        to_write.append((path, data))
+    if len(to_write) < len(pairs):
+        log.info(f"  Skipping {len(pairs) - len(to_write)} unchanged files")
+    
+    # Create the unique set of parent directories once, shallowest first so
+    # each mkdir finds its ancestors already present, then overlap the file
+    # writes in a thread pool -- each write is an I/O-bound syscall that
+    # releases the GIL
+    parent_dirs = sorted({os.path.dirname(path) for path, _ in to_write},
+                         key=lambda d: d.count(os.sep))
+    for parent in parent_dirs:
+        ensure_dir(parent)
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        list(ex.map(lambda pair: _write_bytes(pair[0], pair[1]), to_write))
+    _write_bytes(hash_file, _dumps(new_hashes))
+
+def main(zip_output=False):
+    """Main scaffolding generation function
+
+    With zip_output=True the notebooks and READMEs are streamed into a
+    single scaffold.zip (uncompressed) instead of individual files, which
+    avoids per-file inode and directory-metadata overhead; unzip once to
+    materialize the tree.
+    """
+    log.info("=" * 60)
+    log.info("MIT OCW 18.01 Calculus Repository Scaffolding Generator")
+    log.info("=" * 60)
+    log.info("")
     
-    # Create final exam
-    create_exam_folder(exam_folder, "final-exam")
+    # Create utils directory
+    log.info("Creating utilities directory...")
+    ensure_dir(BASE_DIR / "utils")
     
     # Create supplementary folders
-    print("\n\nCreating supplementary directories...")
-    print("SUPPLEMENTARY")
+    log.info("\nCreating supplementary directories...")
+    log.info("SUPPLEMENTARY")
     supp_folder = BASE_DIR / "supplementary"
-    (supp_folder / "course-reader-notes").mkdir(parents=True, exist_ok=True)
-    (supp_folder / "reference-materials").mkdir(parents=True, exist_ok=True)
-    (supp_folder / "additional-resources").mkdir(parents=True, exist_ok=True)
-    print("  Created course-reader-notes")
-    print("  Created reference-materials")
-    print("  Created additional-resources")
-    
-    # Create README files
-    print("\n\nCreating README files...")
-    for unit_name in COURSE_STRUCTURE.keys():
-        unit_path = BASE_DIR / unit_name
-        readme_path = unit_path / "README.md"
-        with open(readme_path, "w") as f:
-            f.write(f"# {unit_name.replace('-', ' ').title()}\n\n")
-            f.write("This unit contains lecture folders with comprehensive materials.\n")
-    
-    print("\n" + "=" * 60)
-    print("Scaffolding generation complete!")
-    print("=" * 60)
-    print("\nNext steps:")
-    print("1. Install requirements: pip install -r requirements.txt")
-    print("2. Review the structure in your file explorer")
-    print("3. Start filling in content with lecture materials")
-    print("\nTotal notebooks created: Approximately 200+ notebooks")
-    print("=" * 60)
+    ensure_dir(supp_folder / "course-reader-notes")
+    ensure_dir(supp_folder / "reference-materials")
+    ensure_dir(supp_folder / "additional-resources")
+    log.info("  Created course-reader-notes")
+    log.info("  Created reference-materials")
+    log.info("  Created additional-resources")
+    
+    # Plan everything up front, then execute the writes in one pass
+    execute(plan(), zip_output=zip_output)
+    
+    log.info("\n" + "=" * 60)
+    log.info("Scaffolding generation complete!")
+    log.info("=" * 60)
+    log.info("\nNext steps:")
+    log.info("1. Install requirements: pip install -r requirements.txt")
+    log.info("2. Review the structure in your file explorer")
+    log.info("3. Start filling in content with lecture materials")
+    log.info("\nTotal notebooks created: Approximately 200+ notebooks")
+    log.info("=" * 60)
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    main(zip_output="--zip" in sys.argv)
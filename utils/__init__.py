@@ -5,13 +5,70 @@ This package provides comprehensive utilities for calculus operations,
 visualization, and LaTeX rendering in Jupyter notebooks.
 """
 
-from .calculus_utils import *
-from .plotting_utils import *
-from .latex_rendering import *
+import importlib
 
 __version__ = '1.0.0'
 __author__ = 'MIT OCW 18.01 Study Project'
 
+# Lazy attribute loading (PEP 562): map each public name to the submodule
+# that provides it, so `import utils` no longer pulls in sympy, numpy and
+# matplotlib up front -- the heavy imports happen on first attribute access.
+_LAZY = {
+    # From calculus_utils
+    'DerivativeCalculator': '.calculus_utils',
+    'IntegralCalculator': '.calculus_utils',
+    'LimitCalculator': '.calculus_utils',
+    'SeriesCalculator': '.calculus_utils',
+    'NumericalMethods': '.calculus_utils',
+    'derivative': '.calculus_utils',
+    'integrate': '.calculus_utils',
+    'limit': '.calculus_utils',
+    'tangent': '.calculus_utils',
+    'x': '.calculus_utils',
+    'y': '.calculus_utils',
+    'z': '.calculus_utils',
+    't': '.calculus_utils',
+    'n': '.calculus_utils',
+    'k': '.calculus_utils',
+    'm': '.calculus_utils',
+    'a': '.calculus_utils',
+    'b': '.calculus_utils',
+    'c': '.calculus_utils',
+    'h': '.calculus_utils',
+
+    # From plotting_utils
+    'FunctionPlotter': '.plotting_utils',
+    'IntegralVisualizer': '.plotting_utils',
+    'InteractivePlots': '.plotting_utils',
+    'plot': '.plotting_utils',
+    'plot_tangent': '.plotting_utils',
+    'plot_derivative': '.plotting_utils',
+    'plot_area': '.plotting_utils',
+
+    # From latex_rendering
+    'LatexFormatter': '.latex_rendering',
+    'ExpressionSimplifier': '.latex_rendering',
+    'show_equation': '.latex_rendering',
+    'show_derivative': '.latex_rendering',
+    'show_integral': '.latex_rendering',
+    'show_limit': '.latex_rendering',
+    'show_steps': '.latex_rendering',
+}
+
+def __getattr__(name):
+    try:
+        submodule = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    # Cache so subsequent accesses are plain dict hits
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 # Export all utility functions
 __all__ = [
     # From calculus_utils
@@ -24,7 +81,7 @@ __all__ = [
     'integrate',
     'limit',
     'tangent',
-    
+
     # From plotting_utils
     'FunctionPlotter',
     'IntegralVisualizer',
@@ -33,7 +90,7 @@ __all__ = [
     'plot_tangent',
     'plot_derivative',
     'plot_area',
-    
+
     # From latex_rendering
     'LatexFormatter',
     'ExpressionSimplifier',
@@ -12,13 +12,71 @@ import numpy as np
 import sympy as sp
 from sympy import *
 from typing import Union, Tuple, List, Callable
+from functools import lru_cache, wraps
+import threading
 import warnings
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # Initialize SymPy symbols
 x, y, z, t = sp.symbols('x y z t')
 n, k, m = sp.symbols('n k m', integer=True)
 a, b, c, h = sp.symbols('a b c h', real=True)
 
+# Notebooks tend to pass the same expressions over and over (re-running
+# cells, demoing one function several ways), so cache the expensive parse
+# and symbolic steps.  SymPy expressions are hashable and immutable, which
+# makes them safe lru_cache keys.
+
+def _memoize_sym(fn):
+    """Memoize a pure function of hashable (typically SymPy) arguments
+    
+    Unlike lru_cache this degrades gracefully: calls with an unhashable
+    argument fall through to the wrapped function instead of raising.
+    The cache is bounded, evicting oldest-inserted entries first.
+    """
+    cache = {}
+    
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            result = cache[key]
+        except TypeError:
+            return fn(*args, **kwargs)
+        except KeyError:
+            result = fn(*args, **kwargs)
+            if len(cache) >= 256:
+                cache.pop(next(iter(cache)))
+            cache[key] = result
+        return result
+    
+    wrapper._cache = cache
+    return wrapper
+
+@lru_cache(maxsize=1024)
+def _sympify_cached(s):
+    """Parse a string into a SymPy expression, caching repeat parses"""
+    return sp.sympify(s)
+
+@lru_cache(maxsize=1024)
+def _diff_cached(expr, var, order=1):
+    """Differentiate with memoization keyed on (expr, var, order)"""
+    return sp.diff(expr, var, order)
+
+# Wall-clock budget for symbolic definite integration before falling back
+# to numerical quadrature; sympy's integrate has no worst-case bound and
+# can effectively hang on innocent-looking integrands
+_SYMBOLIC_INTEGRATE_TIMEOUT = 1.0
+
+@lru_cache(maxsize=1024)
+def _integrate_cached(expr, var):
+    """Integrate (indefinite) with memoization keyed on (expr, var)"""
+    return sp.integrate(expr, var)
+
 class DerivativeCalculator:
     """Calculate and analyze derivatives"""
     
@@ -35,49 +93,75 @@ class DerivativeCalculator:
             SymPy expression of derivative
         """
         if isinstance(expr, str):
-            expr = sp.sympify(expr)
-        return sp.diff(expr, var, order)
+            expr = _sympify_cached(expr)
+        
+        # Polynomials take the dense coefficient route: Poly.diff is a
+        # linear pass over coefficients with none of the rule dispatch
+        # behind the general sp.diff
+        if isinstance(expr, sp.Basic) and expr.is_polynomial(var):
+            try:
+                return sp.Poly(expr, var).diff((var, order)).as_expr()
+            except sp.PolynomialError:
+                pass
+        
+        return _diff_cached(expr, var, order)
     
     @staticmethod
-    def tangent_line(func, point, var=x):
-        """Find tangent line at a point
+    @_memoize_sym
+    def tangent_and_normal(func, point, var=x):
+        """Find tangent and normal lines at a point sharing one derivative
         
         Args:
             func: Function expression
-            point: x-coordinate of tangent point
+            point: x-coordinate of the point
             var: Variable (default x)
             
         Returns:
-            Tuple of (tangent_line_expr, slope, y_value)
+            Tuple of (tangent_expr, normal_expr, slope, y_value);
+            normal_expr is None when the tangent is horizontal
         """
         if isinstance(func, str):
-            func = sp.sympify(func)
+            func = _sympify_cached(func)
         
-        slope = sp.diff(func, var).subs(var, point)
+        slope = _diff_cached(func, var).subs(var, point)
         y_val = func.subs(var, point)
         tangent = slope * (var - point) + y_val
         
-        return tangent, slope, y_val
-    
-    @staticmethod
-    def normal_line(func, point, var=x):
-        """Find normal line (perpendicular to tangent) at a point"""
-        if isinstance(func, str):
-            func = sp.sympify(func)
-        
-        slope = sp.diff(func, var).subs(var, point)
-        y_val = func.subs(var, point)
-        
         if slope != 0:
-            normal_slope = -1 / slope
-            normal = normal_slope * (var - point) + y_val
+            normal = -1 / slope * (var - point) + y_val
         else:
             # Vertical normal line
             normal = None
+        
+        return tangent, normal, slope, y_val
+    
+    @staticmethod
+    def tangent_line(func, point, var=x):
+        """Find tangent line at a point
+        
+        Args:
+            func: Function expression
+            point: x-coordinate of tangent point
+            var: Variable (default x)
             
+        Returns:
+            Tuple of (tangent_line_expr, slope, y_value)
+        """
+        tangent, _, slope, y_val = DerivativeCalculator.tangent_and_normal(
+            func, point, var
+        )
+        return tangent, slope, y_val
+    
+    @staticmethod
+    def normal_line(func, point, var=x):
+        """Find normal line (perpendicular to tangent) at a point"""
+        _, normal, _, y_val = DerivativeCalculator.tangent_and_normal(
+            func, point, var
+        )
         return normal, y_val
     
     @staticmethod
+    @_memoize_sym
     def implicit_derivative(equation, dependent_var=y, independent_var=x):
         """Compute implicit derivative dy/dx from equation F(x,y) = 0
         
@@ -90,12 +174,12 @@ class DerivativeCalculator:
             Expression for dy/dx
         """
         if isinstance(equation, str):
-            equation = sp.sympify(equation)
+            equation = _sympify_cached(equation)
         
         # Use implicit differentiation: dF/dx + dF/dy * dy/dx = 0
         # Solve for dy/dx = -(dF/dx) / (dF/dy)
-        dF_dx = sp.diff(equation, independent_var)
-        dF_dy = sp.diff(equation, dependent_var)
+        dF_dx = _diff_cached(equation, independent_var)
+        dF_dy = _diff_cached(equation, dependent_var)
         
         dy_dx = -dF_dx / dF_dy
         return sp.simplify(dy_dx)
@@ -115,8 +199,17 @@ class IntegralCalculator:
             Antiderivative (without constant of integration)
         """
         if isinstance(expr, str):
-            expr = sp.sympify(expr)
-        return sp.integrate(expr, var)
+            expr = _sympify_cached(expr)
+        
+        # Polynomial antiderivatives are a coefficient shift; skipping
+        # sp.integrate here bypasses the Risch machinery entirely
+        if isinstance(expr, sp.Basic) and expr.is_polynomial(var):
+            try:
+                return sp.Poly(expr, var).integrate(var).as_expr()
+            except sp.PolynomialError:
+                pass
+        
+        return _integrate_cached(expr, var)
     
     @staticmethod
     def definite_integral(expr, var, lower, upper):
@@ -130,10 +223,44 @@ class IntegralCalculator:
             
         Returns:
             Numerical or symbolic value of definite integral
+        
+        With numeric bounds the symbolic attempt runs under a short
+        wall-clock budget; if it times out or returns an unevaluated
+        Integral, the integrand is lambdified and handed to adaptive
+        Gauss-Kronrod quadrature (scipy.integrate.quad) instead.
+        Symbolic bounds always take the fully symbolic path.
         """
         if isinstance(expr, str):
-            expr = sp.sympify(expr)
-        return sp.integrate(expr, (var, lower, upper))
+            expr = _sympify_cached(expr)
+        
+        bounds_numeric = (sp.sympify(lower).is_number
+                          and sp.sympify(upper).is_number)
+        if not bounds_numeric:
+            return sp.integrate(expr, (var, lower, upper))
+        
+        # Run the symbolic attempt on a daemon thread so a pathological
+        # Risch run can be abandoned after the budget expires.  A daemon
+        # thread (unlike an executor worker) never blocks interpreter
+        # shutdown if the abandoned integrate keeps running.
+        slot = []
+
+        def _attempt():
+            try:
+                slot.append(sp.integrate(expr, (var, lower, upper)))
+            except Exception:
+                pass  # fall through to quadrature
+
+        worker = threading.Thread(target=_attempt, daemon=True)
+        worker.start()
+        worker.join(_SYMBOLIC_INTEGRATE_TIMEOUT)
+        result = slot[0] if slot else None
+        
+        if result is not None and not result.has(sp.Integral):
+            return result
+        
+        f = sp.lambdify(var, expr, 'numpy', cse=True)
+        from scipy.integrate import quad
+        return quad(f, float(lower), float(upper))[0]
     
     @staticmethod
     def area_between_curves(f1, f2, var, lower, upper):
@@ -148,11 +275,48 @@ class IntegralCalculator:
             Area between curves
         """
         if isinstance(f1, str):
-            f1 = sp.sympify(f1)
+            f1 = _sympify_cached(f1)
         if isinstance(f2, str):
-            f2 = sp.sympify(f2)
-        
-        area = sp.integrate(sp.Abs(f1 - f2), (var, lower, upper))
+            f2 = _sympify_cached(f2)
+        
+        diff = f1 - f2
+        
+        # Integrating Abs(f1-f2) directly forces the integrator through
+        # its own case analysis, which is slow and often fails outright.
+        # With numeric bounds, find the sign changes ourselves and sum
+        # plain signed integrals over each subinterval instead.
+        if sp.sympify(lower).is_number and sp.sympify(upper).is_number:
+            try:
+                roots = sp.solve(diff, var)
+            except (NotImplementedError, TypeError):
+                roots = None
+            # The partition is only valid if every root's position in the
+            # interval is decidable; a parametrized root (free symbols,
+            # is_positive -> None) silently dropped here would make the
+            # sum collapse to |net signed integral|, so bail out to the
+            # Abs integral instead.
+            crossings = [] if roots is not None else None
+            for r in roots or ():
+                if r.free_symbols:
+                    crossings = None
+                    break
+                if r.is_real is False:
+                    continue
+                after_lo = (r - lower).is_positive
+                before_hi = (upper - r).is_positive
+                if r.is_real is None or after_lo is None or before_hi is None:
+                    crossings = None
+                    break
+                if after_lo and before_hi:
+                    crossings.append(r)
+            if crossings is not None:
+                bounds = [lower, *sorted(crossings), upper]
+                return sum(
+                    sp.Abs(sp.integrate(diff, (var, lo, hi)))
+                    for lo, hi in zip(bounds, bounds[1:])
+                )
+        
+        area = sp.integrate(sp.Abs(diff), (var, lower, upper))
         return area
     
     @staticmethod
@@ -168,9 +332,12 @@ class IntegralCalculator:
             Volume
         """
         if isinstance(radius_func, str):
-            radius_func = sp.sympify(radius_func)
+            radius_func = _sympify_cached(radius_func)
         
-        volume = sp.pi * sp.integrate(radius_func**2, (var, lower, upper))
+        # Expanding the squared radius up front spares the integrator
+        # from redoing the algebra inside its pattern matcher
+        volume = sp.pi * sp.integrate(sp.expand(radius_func**2),
+                                      (var, lower, upper))
         return volume
     
     @staticmethod
@@ -187,12 +354,12 @@ class IntegralCalculator:
             Volume
         """
         if isinstance(radius_func, str):
-            radius_func = sp.sympify(radius_func)
+            radius_func = _sympify_cached(radius_func)
         if isinstance(height_func, str):
-            height_func = sp.sympify(height_func)
+            height_func = _sympify_cached(height_func)
         
         volume = 2 * sp.pi * sp.integrate(
-            radius_func * height_func, (var, lower, upper)
+            sp.expand(radius_func * height_func), (var, lower, upper)
         )
         return volume
     
@@ -209,10 +376,20 @@ class IntegralCalculator:
             Arc length
         """
         if isinstance(func, str):
-            func = sp.sympify(func)
+            func = _sympify_cached(func)
+        
+        derivative = _diff_cached(func, var)
+        integrand = sp.simplify(sp.sqrt(1 + derivative**2))
+        
+        # If a radical survives simplification, try the radical and trig
+        # normalizers and hand the integrator the tersest form -- most of
+        # sp.integrate's time here goes into recognizing the integrand
+        if any(p.exp == sp.S.Half for p in integrand.atoms(sp.Pow)):
+            integrand = min(
+                (integrand, sp.radsimp(integrand), sp.trigsimp(integrand)),
+                key=lambda e: len(str(e))
+            )
         
-        derivative = sp.diff(func, var)
-        integrand = sp.sqrt(1 + derivative**2)
         length = sp.integrate(integrand, (var, lower, upper))
         return length
 
@@ -233,7 +410,22 @@ class LimitCalculator:
             Limit value
         """
         if isinstance(expr, str):
-            expr = sp.sympify(expr)
+            expr = _sympify_cached(expr)
+        
+        # For two-sided limits at finite points, try plain substitution
+        # first: when the expression is continuous there, it gives the
+        # same answer as the limit machinery at a fraction of the cost.
+        # Indeterminate or unresolved results fall through to sp.limit.
+        if direction is None and point not in (sp.oo, -sp.oo, sp.zoo):
+            try:
+                val = expr.subs(var, point)
+            except (ValueError, ZeroDivisionError):
+                val = None
+            if (val is not None
+                    and val not in (sp.nan, sp.zoo, sp.oo, -sp.oo)
+                    and var not in val.free_symbols
+                    and val.is_finite):
+                return val
         
         if direction == '+':
             return sp.limit(expr, var, point, '+')
@@ -255,7 +447,7 @@ class LimitCalculator:
             Tuple (is_continuous, explanation)
         """
         if isinstance(func, str):
-            func = sp.sympify(func)
+            func = _sympify_cached(func)
         
         try:
             # Check if f(a) exists
@@ -263,13 +455,28 @@ class LimitCalculator:
             if f_a in [sp.nan, sp.zoo, sp.oo, -sp.oo]:
                 return False, f"f({point}) does not exist"
             
+            # Polynomials are continuous everywhere, and rational
+            # functions wherever the denominator is nonzero -- both are
+            # decided without invoking the limit machinery
+            if func.is_polynomial(var):
+                return True, "Function is continuous"
+            if func.is_rational_function(var):
+                _, denom = func.as_numer_denom()
+                if denom.subs(var, point) != 0:
+                    return True, "Function is continuous"
+            
             # Check if limit exists
             lim_val = sp.limit(func, var, point)
             if lim_val in [sp.nan, sp.zoo]:
                 return False, f"limit as x→{point} does not exist"
             
-            # Check if limit equals function value
-            if sp.simplify(lim_val - f_a) == 0:
+            # Check if limit equals function value, cheapest test first:
+            # structural equality is near-free, .equals samples the
+            # difference numerically, and only then pay for simplify
+            if lim_val == f_a:
+                return True, "Function is continuous"
+            diff = lim_val - f_a
+            if diff.equals(0) or sp.simplify(diff) == 0:
                 return True, "Function is continuous"
             else:
                 return False, f"limit = {lim_val} ≠ f({point}) = {f_a}"
@@ -292,17 +499,29 @@ class LimitCalculator:
             Limit value and list of steps
         """
         if isinstance(numerator, str):
-            numerator = sp.sympify(numerator)
+            numerator = _sympify_cached(numerator)
         if isinstance(denominator, str):
-            denominator = sp.sympify(denominator)
+            denominator = _sympify_cached(denominator)
+        
+        def _eval_at(e):
+            # Substitution answers the continuous case at a fraction of
+            # sp.limit's cost; indeterminate or undefined results fall
+            # back to the full limit machinery
+            try:
+                val = e.subs(var, point)
+            except (ValueError, ZeroDivisionError):
+                val = sp.nan
+            if val in (sp.nan, sp.zoo) or var in val.free_symbols:
+                return sp.limit(e, var, point)
+            return val
         
         steps = []
         num, den = numerator, denominator
         
         for i in range(max_iterations):
             # Evaluate current form
-            num_val = sp.limit(num, var, point)
-            den_val = sp.limit(den, var, point)
+            num_val = _eval_at(num)
+            den_val = _eval_at(den)
             
             steps.append({
                 'iteration': i,
@@ -320,8 +539,8 @@ class LimitCalculator:
                     return sp.oo, steps
             
             # Apply L'Hôpital's rule
-            num = sp.diff(num, var)
-            den = sp.diff(den, var)
+            num = _diff_cached(num, var)
+            den = _diff_cached(den, var)
         
         # Final attempt
         result = sp.limit(num / den, var, point)
@@ -331,6 +550,7 @@ class SeriesCalculator:
     """Work with series and sequences"""
     
     @staticmethod
+    @_memoize_sym
     def taylor_series(func, var, point, order):
         """Compute Taylor series expansion
         
@@ -344,7 +564,7 @@ class SeriesCalculator:
             Taylor polynomial
         """
         if isinstance(func, str):
-            func = sp.sympify(func)
+            func = _sympify_cached(func)
         
         return sp.series(func, var, point, order).removeO()
     
@@ -357,15 +577,120 @@ class SeriesCalculator:
     def power_series_representation(func, var, order=10):
         """Find power series representation"""
         if isinstance(func, str):
-            func = sp.sympify(func)
+            func = _sympify_cached(func)
         
         return sp.series(func, var, 0, order)
 
+def _floatify(expr):
+    """Convert large integer and rational constants to floats
+    
+    SymPy's exact integers and rationals survive into the generated
+    lambda and force object-level arithmetic on every evaluation;
+    pre-evaluating them keeps the hot path in plain float/ufunc math.
+    0 and +/-1 are left exact so structural simplifications still fire.
+    """
+    reps = {q: sp.Float(q) for q in expr.atoms(sp.Rational)
+            if q not in (0, 1, -1)}
+    return expr.xreplace(reps) if reps else expr
+
+@lru_cache(maxsize=256)
+def _lambdify_cached(expr, var, modules='numpy'):
+    """Memoized sp.lambdify (always with cse=True)
+    
+    lambdify costs tens of milliseconds per call; convergence sweeps that
+    re-evaluate the same expression with different grids pay it for
+    nothing.  Constants are pre-converted to floats (see _floatify), and
+    scalar math-backend lambdas are additionally njit-compiled when numba
+    is available, so the JIT cost is cached too.
+    """
+    if isinstance(expr, tuple):
+        expr = tuple(_floatify(e) for e in expr)
+    else:
+        expr = _floatify(expr)
+    fn = sp.lambdify(var, expr, modules, cse=True)
+    if modules == 'math' and numba is not None:
+        try:
+            # Compile eagerly with an explicit signature: lazy njit would
+            # defer TypingErrors to the first call inside the iteration
+            # loop, past the point where we could still fall back
+            fn = numba.njit("float64(float64)")(fn)
+        except Exception:
+            pass  # keep the plain math-backend lambda
+    return fn
+
+@lru_cache(maxsize=64)
+def _nodes(lower, upper, n, kind):
+    """Evaluation grid for the quadrature rules, cached per (bounds, n)
+    
+    Convergence sweeps re-request the same grids many times; returning a
+    cached read-only array turns every repeat linspace into a dict hit.
+    """
+    dx = (upper - lower) / n
+    if kind == 'left':
+        arr = np.linspace(lower, upper - dx, n)
+    elif kind == 'right':
+        arr = np.linspace(lower + dx, upper, n)
+    elif kind == 'midpoint':
+        arr = np.linspace(lower + dx/2, upper - dx/2, n)
+    else:  # closed grid with n+1 points (trapezoid, Simpson)
+        arr = np.linspace(lower, upper, n + 1)
+    arr.setflags(write=False)
+    return arr
+
+@lru_cache(maxsize=64)
+def _simpson_weights(n):
+    """Simpson coefficient vector [1, 4, 2, 4, ..., 4, 1] for n intervals"""
+    w = np.empty(n + 1)
+    w[0] = w[-1] = 1
+    w[1:-1:2] = 4
+    w[2:-1:2] = 2
+    w.setflags(write=False)
+    return w
+
+@lru_cache(maxsize=64)
+def _trapezoid_weights(n):
+    """Trapezoid coefficient vector [0.5, 1, ..., 1, 0.5] for n intervals"""
+    w = np.ones(n + 1)
+    w[0] = w[-1] = 0.5
+    w.setflags(write=False)
+    return w
+
+def _newton_core(f, df, x0, tol, max_iterations):
+    """Tight Newton iteration loop shared by newtons_method
+
+    Records per-step values into preallocated arrays and reports a status
+    code (0 converged, 1 derivative near zero, 2 max iterations).  When
+    numba is available this whole loop is JIT-compiled, so each step costs
+    a native call instead of Python-level dispatch.
+    """
+    xs = np.empty(max_iterations)
+    fs = np.empty(max_iterations)
+    dfs = np.empty(max_iterations)
+    xn = x0
+    for i in range(max_iterations):
+        fxn = f(xn)
+        dfxn = df(xn)
+        xs[i] = xn
+        fs[i] = fxn
+        dfs[i] = dfxn
+        if abs(fxn) < tol:
+            return xn, i + 1, 0, xs, fs, dfs
+        if abs(dfxn) < 1e-15:
+            return xn, i + 1, 1, xs, fs, dfs
+        xn = xn - fxn / dfxn
+    return xn, max_iterations, 2, xs, fs, dfs
+
+# No cache=True here: functions taking dispatcher arguments (the f/df
+# callbacks) cannot be disk-cached and numba only warns about it
+if numba is not None:
+    _newton_core = numba.njit(_newton_core)
+
 class NumericalMethods:
     """Numerical methods for calculus"""
     
     @staticmethod
-    def newtons_method(func, initial_guess, var=x, tolerance=1e-10, max_iterations=100):
+    def newtons_method(func, initial_guess, var=x, tolerance=1e-10, max_iterations=100,
+                       record=True):
         """Find root using Newton's method
         
         Args:
@@ -374,42 +699,99 @@ class NumericalMethods:
             var: Variable
             tolerance: Convergence tolerance
             max_iterations: Maximum iterations
+            record: Build the per-iteration history dicts (default True)
             
         Returns:
-            Tuple (root, iterations_list)
+            Tuple (root, iterations_list), or (root, n_iters) with
+            record=False -- callers that only want the root skip the
+            per-step dict and float boxing entirely
+        
+        The function and derivative are lambdified with the math backend:
+        the iterates are plain Python floats, and scalar math calls skip
+        the 0-d array boxing the numpy backend would pay on every step.
         """
         if isinstance(func, str):
-            func = sp.sympify(func)
-        
-        # Convert to numerical function
-        f = sp.lambdify(var, func, 'numpy')
-        df = sp.lambdify(var, sp.diff(func, var), 'numpy')
+            func = _sympify_cached(func)
+        
+        # Convert to numerical functions; for the scalar Newton loop the
+        # math backend avoids numpy's per-call array machinery, and with
+        # numba present both lambdas compile to native code (handled
+        # inside _lambdify_cached)
+        f = _lambdify_cached(func, var, 'math')
+        df = _lambdify_cached(_diff_cached(func, var), var, 'math')
+
+        # The compiled core only accepts compiled callbacks: handing it a
+        # plain lambda (one whose eager njit failed in _lambdify_cached)
+        # raises a TypingError.  Dispatchers carry a py_func attribute,
+        # so use its presence to pick the core that matches.
+        core = _newton_core
+        if numba is not None and not (hasattr(f, 'py_func')
+                                      and hasattr(df, 'py_func')):
+            core = _newton_core.py_func
+
+        root, n_iters, status, xs, fs, dfs = core(
+            f, df, float(initial_guess), tolerance, max_iterations
+        )
+        if record:
+            history = [
+                {'iteration': i, 'x': xs[i], 'f(x)': fs[i], "f'(x)": dfs[i]}
+                for i in range(n_iters)
+            ]
+        else:
+            history = n_iters
+        
+        if status == 1:
+            warnings.warn("Derivative near zero, Newton's method may fail")
+            return None, history
+        if status == 2:
+            warnings.warn("Maximum iterations reached")
+        return root, history
+    
+    @staticmethod
+    def newtons_method_batch(func, initial_guesses, var=x, tolerance=1e-10,
+                             max_iterations=100):
+        """Run Newton's method on many initial guesses at once
         
-        iterations = []
-        xn = float(initial_guess)
+        All seeds iterate simultaneously on NumPy arrays, so probing
+        several roots costs one lambdify and one vectorized loop instead
+        of a Python-level Newton run per seed.
         
-        for i in range(max_iterations):
-            fxn = f(xn)
-            dfxn = df(xn)
-            
-            iterations.append({
-                'iteration': i,
-                'x': xn,
-                'f(x)': fxn,
-                "f'(x)": dfxn
-            })
-            
-            if abs(fxn) < tolerance:
-                return xn, iterations
-            
-            if abs(dfxn) < 1e-15:
-                warnings.warn("Derivative near zero, Newton's method may fail")
-                return None, iterations
+        Args:
+            func: Function to find roots of
+            initial_guesses: Array-like of starting points
+            var: Variable
+            tolerance: Convergence tolerance
+            max_iterations: Maximum iterations
             
-            xn = xn - fxn / dfxn
-        
-        warnings.warn("Maximum iterations reached")
-        return xn, iterations
+        Returns:
+            Tuple (roots_array, iterations_array); entries that never
+            converged hold their last iterate and max_iterations
+        """
+        if isinstance(func, str):
+            func = _sympify_cached(func)
+        
+        # One joint lambdify shares subexpressions between f and f'
+        fdf = _lambdify_cached((func, _diff_cached(func, var)), var)
+        
+        xn = np.array(initial_guesses, dtype=float)
+        iters = np.zeros(xn.shape, dtype=int)
+        converged = np.zeros(xn.shape, dtype=bool)
+        
+        for _ in range(max_iterations):
+            fv, dv = fdf(xn)
+            # Constant terms come back as scalars; broadcast to full shape
+            fv = np.broadcast_to(np.asarray(fv, dtype=float), xn.shape)
+            dv = np.broadcast_to(np.asarray(dv, dtype=float), xn.shape)
+            converged = converged | (np.abs(fv) < tolerance)
+            if converged.all():
+                break
+            active = ~converged & (np.abs(dv) > 1e-15)
+            step = np.zeros_like(xn)
+            np.divide(fv, dv, out=step, where=active)
+            xn = np.where(active, xn - step, xn)
+            iters += active
+        
+        return xn, iters
     
     @staticmethod
     def riemann_sum(func, lower, upper, n, method='midpoint', var=x):
@@ -426,24 +808,22 @@ class NumericalMethods:
             Approximation of integral
         """
         if isinstance(func, str):
-            func = sp.sympify(func)
+            func = _sympify_cached(func)
         
-        f = sp.lambdify(var, func, 'numpy')
+        f = _lambdify_cached(func, var)
         dx = (upper - lower) / n
         
-        if method == 'left':
-            x_vals = np.linspace(lower, upper - dx, n)
-            return np.sum(f(x_vals) * dx)
-        elif method == 'right':
-            x_vals = np.linspace(lower + dx, upper, n)
-            return np.sum(f(x_vals) * dx)
-        elif method == 'midpoint':
-            x_vals = np.linspace(lower + dx/2, upper - dx/2, n)
-            return np.sum(f(x_vals) * dx)
+        if method in ('left', 'right', 'midpoint'):
+            nodes = _nodes(lower, upper, n, method)
+            # Constant integrands come back as scalars; broadcast to grid
+            y = np.broadcast_to(np.asarray(f(nodes), dtype=float), nodes.shape)
+            return dx * y.sum()
         elif method == 'trapezoid':
-            x_vals = np.linspace(lower, upper, n + 1)
-            y_vals = f(x_vals)
-            return dx * (np.sum(y_vals) - (y_vals[0] + y_vals[-1])/2)
+            # Weighted dot makes one streaming pass over y_vals with no
+            # endpoint-correction intermediate
+            nodes = _nodes(lower, upper, n, 'closed')
+            y = np.broadcast_to(np.asarray(f(nodes), dtype=float), nodes.shape)
+            return dx * (_trapezoid_weights(n) @ y)
     
     @staticmethod
     def simpsons_rule(func, lower, upper, n, var=x):
@@ -462,20 +842,18 @@ class NumericalMethods:
             raise ValueError("n must be even for Simpson's rule")
         
         if isinstance(func, str):
-            func = sp.sympify(func)
+            func = _sympify_cached(func)
         
-        f = sp.lambdify(var, func, 'numpy')
+        f = _lambdify_cached(func, var)
         h = (upper - lower) / n
-        x_vals = np.linspace(lower, upper, n + 1)
-        y_vals = f(x_vals)
-        
-        # Simpson's rule: (h/3) * [y0 + 4*y1 + 2*y2 + 4*y3 + ... + yn]
-        result = y_vals[0] + y_vals[-1]
-        result += 4 * np.sum(y_vals[1:-1:2])  # Odd indices
-        result += 2 * np.sum(y_vals[2:-1:2])  # Even indices
-        result *= h / 3
-        
-        return result
+        nodes = _nodes(lower, upper, n, 'closed')
+        # Constant integrands come back as scalars; broadcast to grid
+        y_vals = np.broadcast_to(np.asarray(f(nodes), dtype=float), nodes.shape)
+        
+        # Simpson's rule: (h/3) * [y0 + 4*y1 + 2*y2 + 4*y3 + ... + yn],
+        # expressed as one dot product against a cached weight vector so
+        # y_vals is streamed through once instead of three slice passes
+        return (h / 3) * (_simpson_weights(n) @ y_vals)
 
 # Convenience functions for quick calculations
 def derivative(expr, var=x, order=1):
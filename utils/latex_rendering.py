@@ -8,8 +8,23 @@ using LaTeX syntax with SymPy integration.
 import sympy as sp
 from sympy import latex, simplify, expand, factor, cancel
 from IPython.display import display, Math, Markdown, Latex
+from functools import lru_cache
 import re
 
+# Re-rendering a notebook cell repeats the same simplification; cache the
+# expensive canonicalizing transforms on the (hashable) expression itself
+@lru_cache(maxsize=256)
+def _expand_cached(expr):
+    return expand(expr)
+
+@lru_cache(maxsize=256)
+def _factor_cached(expr):
+    return factor(expr)
+
+@lru_cache(maxsize=256)
+def _simplify_cached(expr):
+    return simplify(expr)
+
 class LatexFormatter:
     """Format mathematical expressions in LaTeX"""
     
@@ -193,26 +208,27 @@ class LatexFormatter:
         Returns:
             Displays formatted steps
         """
-        md_str = f"### {title}\n\n"
+        # Collect fragments and join once at the end -- repeated string
+        # concatenation is quadratic in the number of steps
+        parts = [f"### {title}\n\n"]
         
         for i, (description, expr) in enumerate(steps, 1):
-            md_str += f"**Step {i}:** {description}\n\n"
+            parts.append(f"**Step {i}:** {description}\n\n")
             
             if isinstance(expr, str):
                 # Plain text or already formatted LaTeX
                 if '$' in expr or '\\' in expr:
-                    md_str += f"{expr}\n\n"
+                    parts.append(f"{expr}\n\n")
                 else:
                     try:
-                        expr = sp.sympify(expr)
-                        md_str += f"$${latex(expr)}$$\n\n"
+                        parts.append(f"$${latex(sp.sympify(expr))}$$\n\n")
                     except:
-                        md_str += f"{expr}\n\n"
+                        parts.append(f"{expr}\n\n")
             else:
                 # SymPy expression
-                md_str += f"$${latex(expr)}$$\n\n"
+                parts.append(f"$${latex(expr)}$$\n\n")
         
-        display(Markdown(md_str))
+        display(Markdown(''.join(parts)))
     
     @staticmethod
     def format_problem_solution(problem, solution_steps, answer):
@@ -226,24 +242,26 @@ class LatexFormatter:
         Returns:
             Displays formatted problem and solution
         """
-        md_str = f"""\n### Problem\n\n{problem}\n\n---\n\n### Solution\n\n"""
+        # Same join-once pattern as format_step_by_step: appending to a
+        # list keeps assembly linear in the number of steps
+        parts = [f"""\n### Problem\n\n{problem}\n\n---\n\n### Solution\n\n"""]
         
         for i, (description, expr) in enumerate(solution_steps, 1):
-            md_str += f"**Step {i}:** {description}\n\n"
+            parts.append(f"**Step {i}:** {description}\n\n")
             
             if expr is not None:
                 if isinstance(expr, str):
-                    md_str += f"{expr}\n\n"
+                    parts.append(f"{expr}\n\n")
                 else:
-                    md_str += f"$${latex(expr)}$$\n\n"
+                    parts.append(f"$${latex(expr)}$$\n\n")
         
-        md_str += f"---\n\n### Answer\n\n"
+        parts.append("---\n\n### Answer\n\n")
         if isinstance(answer, str):
-            md_str += f"{answer}\n"
+            parts.append(f"{answer}\n")
         else:
-            md_str += f"$${latex(answer)}$$\n"
+            parts.append(f"$${latex(answer)}$$\n")
         
-        display(Markdown(md_str))
+        display(Markdown(''.join(parts)))
 
 class ExpressionSimplifier:
     """Simplify and manipulate expressions with formatted output"""
@@ -265,24 +283,28 @@ class ExpressionSimplifier:
         print("Original expression:")
         display(Math(latex(expr)))
         
+        # simplify dominates the cost here, so run it exactly once and
+        # reuse the value for both the intermediate step and the result.
+        # The identity checks skip the structural comparison entirely when
+        # a transform hands back the same object unchanged.
+        result = _simplify_cached(expr)
+        
         if steps:
             # Try different simplification approaches
-            expanded = expand(expr)
-            if expanded != expr:
+            expanded = _expand_cached(expr)
+            if expanded is not expr and expanded != expr:
                 print("\nExpanded form:")
                 display(Math(latex(expanded)))
             
-            factored = factor(expr)
-            if factored != expr:
+            factored = _factor_cached(expr)
+            if factored is not expr and factored != expr:
                 print("\nFactored form:")
                 display(Math(latex(factored)))
             
-            simplified = simplify(expr)
-            if simplified != expr:
+            if result is not expr and result != expr:
                 print("\nSimplified form:")
-                display(Math(latex(simplified)))
+                display(Math(latex(result)))
         
-        result = simplify(expr)
         print("\nFinal result:")
         display(Math(latex(result)))
         
@@ -11,26 +11,123 @@ Comprehensive visualization tools for calculus concepts including:
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Polygon
 import sympy as sp
-from sympy import lambdify
 import plotly.graph_objects as go
 import plotly.express as px
 from typing import Union, List, Tuple, Callable
+from functools import lru_cache
 import warnings
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# numpy 2 renamed trapz to trapezoid
+_trapezoid = getattr(np, 'trapezoid', getattr(np, 'trapz', None))
+
 # Set default matplotlib style
 plt.style.use('seaborn-v0_8-darkgrid')
 plt.rcParams['figure.figsize'] = (10, 6)
 plt.rcParams['font.size'] = 11
 
+@lru_cache(maxsize=256)
+def _cached_lambdify(func_key, var_key, modules='numpy'):
+    """Build a numerical function from srepr keys, caching the result
+    
+    Compiling a lambdified function costs far more than evaluating it, so
+    interactive use -- re-running plot cells, slider frames -- should pay
+    it once per expression.  srepr strings make stable hashable keys that
+    round-trip assumptions through sympify.
+    
+    Polynomials skip lambdify altogether: their coefficients are pulled
+    once and evaluated with np.polyval, whose Horner loop beats the
+    chain of np.power calls lambdify would generate.
+
+    Larger non-polynomial expressions go through numexpr when it can
+    print them: its compiled kernel fuses the whole expression into one
+    blocked, threaded pass over the grid, instead of numpy materializing
+    an intermediate array per operator.  Anything numexpr cannot handle
+    falls back to the plain numpy lambdify.
+    """
+    func = sp.sympify(func_key)
+    var = sp.sympify(var_key)
+    if modules == 'numpy' and isinstance(func, sp.Expr):
+        if func.is_polynomial(var):
+            try:
+                coeffs = np.array([float(c) for c in sp.Poly(func, var).all_coeffs()])
+            except (sp.PolynomialError, TypeError):
+                pass
+            else:
+                return lambda x: np.polyval(coeffs, x)
+        elif sp.count_ops(func) > 3:
+            try:
+                return sp.lambdify(var, func, 'numexpr')
+            except Exception:
+                pass
+    return sp.lambdify(var, func, modules, cse=True)
+
+def _lambdify(func, var, modules='numpy'):
+    """Memoized front-end for sp.lambdify used by all plot helpers"""
+    return _cached_lambdify(sp.srepr(func), sp.srepr(var), modules)
+
+@lru_cache(maxsize=256)
+def _cached_diff(func_key, var_key):
+    return sp.diff(sp.sympify(func_key), sp.sympify(var_key))
+
+def _diff(func, var):
+    """Memoized sp.diff, keyed like the lambdify cache
+    
+    Re-running a tangent or derivative plot on the same expression then
+    skips both the symbolic differentiation and the recompile.
+    """
+    return _cached_diff(sp.srepr(func), sp.srepr(var))
+
+@lru_cache(maxsize=256)
+def _cached_fast_callable(func_key, var_key):
+    fn = sp.lambdify(sp.sympify(var_key), sp.sympify(func_key), 'math', cse=True)
+    if numba is not None:
+        try:
+            # Eager compilation with an explicit signature raises typing
+            # failures here, where the plain lambda is still in hand --
+            # lazy njit would defer them to the first call site
+            fn = numba.njit("float64(float64)")(fn)
+        except Exception:
+            pass
+    return fn
+
+def _decorate(ax, xlabel='x', ylabel='y', title=None, legend=False):
+    """Apply the axis decorations shared by every 2-D plot helper"""
+    ax.axhline(y=0, color='k', linewidth=0.5)
+    ax.axvline(x=0, color='k', linewidth=0.5)
+    ax.grid(True, alpha=0.3)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    if title:
+        ax.set_title(title)
+    if legend:
+        ax.legend()
+
+def _fast_callable(expr, var):
+    """Scalar callable for expr, JIT-compiled when numba is available
+    
+    For code that calls f once per element from a Python loop, the math
+    backend skips numpy's 0-d array boxing and njit removes the remaining
+    per-call dispatch.  Expressions the math backend cannot handle fall
+    back to the cached numpy lambda.
+    """
+    try:
+        return _cached_fast_callable(sp.srepr(expr), sp.srepr(var))
+    except Exception:
+        return _lambdify(expr, var)
+
 class FunctionPlotter:
     """Plot functions and their properties"""
     
     @staticmethod
     def plot_function(func, var, x_range=(-10, 10), num_points=1000, 
-                     title=None, xlabel='x', ylabel='f(x)', ax=None):
+                     title=None, xlabel='x', ylabel='f(x)', dtype=np.float32,
+                     ax=None):
         """Plot a function
         
         Args:
@@ -40,6 +137,8 @@ class FunctionPlotter:
             num_points: Number of points to plot
             title: Plot title
             xlabel, ylabel: Axis labels
+            dtype: Sample-grid dtype; float32 is plenty for screen
+                resolution and halves the memory traffic
             ax: Matplotlib axis (creates new if None)
             
         Returns:
@@ -50,11 +149,11 @@ class FunctionPlotter:
         
         # Convert to numerical function if SymPy
         if isinstance(func, sp.Basic):
-            f = lambdify(var, func, 'numpy')
+            f = _lambdify(func, var)
         else:
             f = func
         
-        x_vals = np.linspace(x_range[0], x_range[1], num_points)
+        x_vals = np.linspace(x_range[0], x_range[1], num_points, dtype=dtype)
         
         try:
             y_vals = f(x_vals)
@@ -62,16 +161,7 @@ class FunctionPlotter:
         except Exception as e:
             warnings.warn(f"Error plotting function: {e}")
         
-        ax.axhline(y=0, color='k', linewidth=0.5)
-        ax.axvline(x=0, color='k', linewidth=0.5)
-        ax.grid(True, alpha=0.3)
-        ax.set_xlabel(xlabel)
-        ax.set_ylabel(ylabel)
-        
-        if title:
-            ax.set_title(title)
-        
-        ax.legend()
+        _decorate(ax, xlabel, ylabel, title, legend=True)
         return ax
     
     @staticmethod
@@ -92,33 +182,30 @@ class FunctionPlotter:
             fig, ax = plt.subplots(figsize=(10, 6))
         
         # Plot function
-        f = lambdify(var, func, 'numpy')
+        f = _lambdify(func, var)
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
         y_vals = f(x_vals)
         ax.plot(x_vals, y_vals, 'b-', linewidth=2, label='f(x)')
         
-        # Calculate tangent line
-        slope = sp.diff(func, var).subs(var, point)
-        y_point = func.subs(var, point)
-        tangent_func = slope * (var - point) + y_point
+        # Calculate tangent line -- the point values are scalar, so use
+        # the fast scalar callables instead of symbolic substitution,
+        # which is the slowest way to evaluate at a number
+        y_point = _fast_callable(func, var)(float(point))
+        slope = _fast_callable(_diff(func, var), var)(float(point))
         
-        # Plot tangent line
-        tangent_f = lambdify(var, tangent_func, 'numpy')
-        y_tangent = tangent_f(x_vals)
+        # Plot tangent line -- an affine form needs no lambdify, just
+        # numpy arithmetic on the grid already in hand
+        y_tangent = slope * (x_vals - float(point)) + y_point
         ax.plot(x_vals, y_tangent, 'r--', linewidth=2, 
                 label=f'Tangent at x={point}')
         
         # Mark the point
-        ax.plot(point, float(y_point), 'ro', markersize=10, 
-                label=f'Point ({point}, {float(y_point):.2f})')
+        ax.plot(point, y_point, 'ro', markersize=10, 
+                label=f'Point ({point}, {y_point:.2f})')
         
-        ax.axhline(y=0, color='k', linewidth=0.5)
-        ax.axvline(x=0, color='k', linewidth=0.5)
-        ax.grid(True, alpha=0.3)
-        ax.set_xlabel('x')
-        ax.set_ylabel('y')
-        ax.set_title(f'Function with Tangent Line (slope = {float(slope):.3f})')
-        ax.legend()
+        _decorate(ax, 'x', 'y',
+                  f'Function with Tangent Line (slope = {slope:.3f})',
+                  legend=True)
         
         return ax
     
@@ -143,28 +230,19 @@ class FunctionPlotter:
         
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
         
+        # Lambdify function and derivative together: cse factors the
+        # subexpressions they share, and one call over the grid replaces
+        # two separate traversals
+        fdf = _lambdify((func, _diff(func, var)), var)
+        y_vals, dy_vals = fdf(x_vals)
+        
         # Plot original function
-        f = lambdify(var, func, 'numpy')
-        y_vals = f(x_vals)
         ax1.plot(x_vals, y_vals, 'b-', linewidth=2)
-        ax1.axhline(y=0, color='k', linewidth=0.5)
-        ax1.axvline(x=0, color='k', linewidth=0.5)
-        ax1.grid(True, alpha=0.3)
-        ax1.set_xlabel('x')
-        ax1.set_ylabel('f(x)')
-        ax1.set_title('Original Function f(x)')
+        _decorate(ax1, 'x', 'f(x)', 'Original Function f(x)')
         
         # Plot derivative
-        derivative = sp.diff(func, var)
-        df = lambdify(var, derivative, 'numpy')
-        dy_vals = df(x_vals)
         ax2.plot(x_vals, dy_vals, 'r-', linewidth=2)
-        ax2.axhline(y=0, color='k', linewidth=0.5)
-        ax2.axvline(x=0, color='k', linewidth=0.5)
-        ax2.grid(True, alpha=0.3)
-        ax2.set_xlabel('x')
-        ax2.set_ylabel("f'(x)")
-        ax2.set_title("Derivative f'(x)")
+        _decorate(ax2, 'x', "f'(x)", "Derivative f'(x)")
         
         plt.tight_layout()
         return fig, (ax1, ax2)
@@ -173,7 +251,8 @@ class IntegralVisualizer:
     """Visualize integrals and areas"""
     
     @staticmethod
-    def plot_riemann_sum(func, var, lower, upper, n, method='midpoint', ax=None):
+    def plot_riemann_sum(func, var, lower, upper, n, method='midpoint',
+                         dtype=np.float32, ax=None):
         """Visualize Riemann sum approximation
         
         Args:
@@ -182,6 +261,7 @@ class IntegralVisualizer:
             lower, upper: Integration bounds
             n: Number of rectangles
             method: 'left', 'right', or 'midpoint'
+            dtype: Curve sample dtype (rectangle math stays float64)
             ax: Matplotlib axis
             
         Returns:
@@ -191,57 +271,44 @@ class IntegralVisualizer:
             fig, ax = plt.subplots(figsize=(12, 6))
         
         # Plot function
-        f = lambdify(var, func, 'numpy')
-        x_vals = np.linspace(lower, upper, 1000)
+        f = _lambdify(func, var)
+        x_vals = np.linspace(lower, upper, 1000, dtype=dtype)
         y_vals = f(x_vals)
         ax.plot(x_vals, y_vals, 'b-', linewidth=2, label='f(x)', zorder=3)
         
-        # Draw rectangles
+        # Draw rectangles in one vectorized pass: a single f(xi) array
+        # call and one ax.bar call instead of n Rectangle patches added
+        # one by one.  bar handles the vertex geometry itself, so there
+        # is no per-rectangle Python work left at all.
         dx = (upper - lower) / n
+        offset = {'left': 0.0, 'right': 1.0}.get(method, 0.5)
+        rect_x = lower + np.arange(n) * dx
+        heights = f(rect_x + offset * dx)
+
+        ax.bar(rect_x, heights, width=dx, align='edge', linewidth=1,
+               edgecolor='red', facecolor='lightblue', alpha=0.5, zorder=1)
         
-        for i in range(n):
-            if method == 'left':
-                xi = lower + i * dx
-            elif method == 'right':
-                xi = lower + (i + 1) * dx
-            else:  # midpoint
-                xi = lower + (i + 0.5) * dx
-            
-            height = f(xi)
-            rect_x = lower + i * dx
-            
-            rect = patches.Rectangle((rect_x, 0), dx, height, 
-                                     linewidth=1, edgecolor='red', 
-                                     facecolor='lightblue', alpha=0.5, zorder=1)
-            ax.add_patch(rect)
-        
-        # Calculate and display sum
-        if method == 'left':
-            x_sample = np.linspace(lower, upper - dx, n)
-        elif method == 'right':
-            x_sample = np.linspace(lower + dx, upper, n)
-        else:
-            x_sample = np.linspace(lower + dx/2, upper - dx/2, n)
-        
-        riemann_sum = np.sum(f(x_sample) * dx)
+        # Calculate and display sum, reusing the rectangle heights
+        riemann_sum = heights.sum() * dx
         
-        ax.axhline(y=0, color='k', linewidth=0.5)
-        ax.grid(True, alpha=0.3, zorder=0)
-        ax.set_xlabel('x')
-        ax.set_ylabel('f(x)')
-        ax.set_title(f'{method.capitalize()} Riemann Sum (n={n})\nApproximation: {riemann_sum:.4f}')
-        ax.legend()
+        _decorate(ax, 'x', 'f(x)',
+                  f'{method.capitalize()} Riemann Sum (n={n})\nApproximation: {riemann_sum:.4f}',
+                  legend=True)
         
         return ax
     
     @staticmethod
-    def plot_area_between_curves(f1, f2, var, lower, upper, ax=None):
+    def plot_area_between_curves(f1, f2, var, lower, upper, exact=False,
+                                 dtype=np.float32, ax=None):
         """Visualize area between two curves
         
         Args:
             f1, f2: Two functions
             var: Variable
             lower, upper: Bounds
+            exact: Compute the area symbolically instead of from the
+                sampled curves (slower, can fail on hard integrands)
+            dtype: Curve sample dtype
             ax: Matplotlib axis
             
         Returns:
@@ -251,10 +318,10 @@ class IntegralVisualizer:
             fig, ax = plt.subplots(figsize=(10, 6))
         
         # Convert to numerical functions
-        func1 = lambdify(var, f1, 'numpy')
-        func2 = lambdify(var, f2, 'numpy')
+        func1 = _lambdify(f1, var)
+        func2 = _lambdify(f2, var)
         
-        x_vals = np.linspace(lower, upper, 1000)
+        x_vals = np.linspace(lower, upper, 1000, dtype=dtype)
         y1_vals = func1(x_vals)
         y2_vals = func2(x_vals)
         
@@ -265,22 +332,27 @@ class IntegralVisualizer:
         # Fill area between curves
         ax.fill_between(x_vals, y1_vals, y2_vals, alpha=0.3, color='green')
         
-        # Calculate area
-        area = sp.integrate(sp.Abs(f1 - f2), (var, lower, upper))
+        # Calculate area: the 1000-point samples are already on hand, so
+        # trapezoid quadrature gives the title value in bounded time;
+        # symbolic integration of Abs(f1-f2) is opt-in via exact=True
+        if exact:
+            area = sp.integrate(sp.Abs(f1 - f2), (var, lower, upper))
+        else:
+            # Accumulate the quadrature in float64 even when the plot
+            # grid is single-precision
+            area = float(_trapezoid(np.abs(y1_vals - y2_vals).astype(np.float64),
+                                    x_vals.astype(np.float64)))
         
-        ax.axhline(y=0, color='k', linewidth=0.5)
         ax.axvline(x=lower, color='k', linewidth=0.5, linestyle='--', alpha=0.5)
         ax.axvline(x=upper, color='k', linewidth=0.5, linestyle='--', alpha=0.5)
-        ax.grid(True, alpha=0.3)
-        ax.set_xlabel('x')
-        ax.set_ylabel('y')
-        ax.set_title(f'Area Between Curves: {float(area):.4f}')
-        ax.legend()
+        _decorate(ax, 'x', 'y', f'Area Between Curves: {float(area):.4f}',
+                  legend=True)
         
         return ax, area
     
     @staticmethod
-    def plot_volume_of_revolution(func, var, lower, upper, axis='x', n_slices=50, ax=None):
+    def plot_volume_of_revolution(func, var, lower, upper, axis='x', n_slices=50,
+                                  exact=False, ax=None):
         """Visualize volume of revolution (disk method)
         
         Args:
@@ -289,45 +361,58 @@ class IntegralVisualizer:
             lower, upper: Bounds
             axis: 'x' or 'y' axis of rotation
             n_slices: Number of disks to show
+            exact: Compute the volume symbolically instead of from the
+                sampled surface
             ax: Matplotlib axis (must be 3D)
             
         Returns:
             Matplotlib 3D axis
         """
         from mpl_toolkits.mplot3d import Axes3D
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
         
         if ax is None:
             fig = plt.figure(figsize=(12, 8))
             ax = fig.add_subplot(111, projection='3d')
         
-        f = lambdify(var, func, 'numpy')
+        f = _lambdify(func, var)
         
-        # Create slices
-        x_slices = np.linspace(lower, upper, n_slices)
-        
-        for x_pos in x_slices:
-            radius = abs(f(x_pos))
-            
-            # Create circle for this slice
-            theta = np.linspace(0, 2*np.pi, 50)
-            y_circle = radius * np.cos(theta)
-            z_circle = radius * np.sin(theta)
-            x_circle = np.full_like(theta, x_pos)
-            
-            ax.plot(x_circle, y_circle, z_circle, 'b-', alpha=0.3, linewidth=0.5)
-        
-        # Create surface
+        # Create surface.  The radius only depends on x, so evaluate f on
+        # the 1-D grid and broadcast across theta rather than calling it
+        # on the full meshgrid (100x fewer evaluations).  The old
+        # per-slice circle loop is gone too: it added n_slices separate
+        # 3-D line artists for a shape the surface already shows.
         x_surf = np.linspace(lower, upper, 100)
         theta_surf = np.linspace(0, 2*np.pi, 100)
         X, Theta = np.meshgrid(x_surf, theta_surf)
-        R = np.abs(f(X))
+        r = np.abs(f(x_surf))
+        R = np.broadcast_to(r, Theta.shape)
         Y = R * np.cos(Theta)
         Z = R * np.sin(Theta)
         
+        # Outline the disks as one collection: n_slices circle segments
+        # in a single Line3DCollection cost one artist, not one ax.plot
+        # call per slice
+        x_slices = np.linspace(lower, upper, n_slices)
+        radii = np.broadcast_to(np.abs(f(x_slices)), x_slices.shape)
+        theta = np.linspace(0, 2*np.pi, 50)
+        segments = np.empty((n_slices, theta.size, 3))
+        segments[:, :, 0] = x_slices[:, None]
+        segments[:, :, 1] = radii[:, None] * np.cos(theta)
+        segments[:, :, 2] = radii[:, None] * np.sin(theta)
+        ax.add_collection3d(Line3DCollection(
+            segments, colors='blue', alpha=0.3, linewidths=0.5
+        ))
+        
         ax.plot_surface(X, Y, Z, alpha=0.6, cmap='viridis')
         
-        # Calculate volume
-        volume = float(sp.pi * sp.integrate(func**2, (var, lower, upper)))
+        # Calculate volume from the samples already used for the surface
+        # (disk method on the plotting grid); symbolic integration stays
+        # available behind exact=True
+        if exact:
+            volume = float(sp.pi * sp.integrate(func**2, (var, lower, upper)))
+        else:
+            volume = float(np.pi * _trapezoid(R[0]**2, x_surf))
         
         ax.set_xlabel('x')
         ax.set_ylabel('y')
@@ -340,7 +425,8 @@ class InteractivePlots:
     """Interactive plotly visualizations"""
     
     @staticmethod
-    def interactive_function(func, var, x_range=(-10, 10), num_points=1000):
+    def interactive_function(func, var, x_range=(-10, 10), num_points=1000,
+                             dtype=np.float32):
         """Create interactive function plot with Plotly
         
         Args:
@@ -348,12 +434,14 @@ class InteractivePlots:
             var: Variable
             x_range: x-axis range
             num_points: Number of points
+            dtype: Sample-grid dtype; float32 also halves the JSON the
+                figure ships to the browser
             
         Returns:
             Plotly figure object
         """
-        f = lambdify(var, func, 'numpy')
-        x_vals = np.linspace(x_range[0], x_range[1], num_points)
+        f = _lambdify(func, var)
+        x_vals = np.linspace(x_range[0], x_range[1], num_points, dtype=dtype)
         y_vals = f(x_vals)
         
         fig = go.Figure()
@@ -387,29 +475,36 @@ class InteractivePlots:
         Returns:
             Plotly figure with slider
         """
-        f = lambdify(var, func, 'numpy')
-        df = lambdify(var, sp.diff(func, var), 'numpy')
-        
+        f = _lambdify(func, var)
+        fdf = _lambdify((func, _diff(func, var)), var)
+
         x_vals = np.linspace(x_range[0], x_range[1], 1000)
         y_vals = f(x_vals)
         
-        # Create frames for different tangent points
-        frames = []
+        # Create frames for different tangent points.  Each frame carries
+        # only the two traces that actually change (tangent and marker);
+        # the static curve lives once in fig.data, which halves the JSON
+        # payload plotly ships to the browser.  The per-point function and
+        # slope values come from one joint vectorized call instead of 50
+        # scalar evaluations each.
         tangent_points = np.linspace(x_range[0], x_range[1], 50)
+        y0, dy = fdf(tangent_points)
+        y0 = np.broadcast_to(y0, tangent_points.shape)
+        dy = np.broadcast_to(dy, tangent_points.shape)
         
-        for point in tangent_points:
-            y_point = f(point)
-            slope = df(point)
-            y_tangent = slope * (x_vals - point) + y_point
+        # Frames patch the data of the existing traces rather than
+        # instantiating fresh Scatter objects -- styling stays on the
+        # initial traces, so each frame is just the numeric arrays
+        frames = []
+        for i, point in enumerate(tangent_points):
+            y_tangent = dy[i] * (x_vals - point) + y0[i]
             
             frame = go.Frame(
                 data=[
-                    go.Scatter(x=x_vals, y=y_vals, mode='lines', name='f(x)'),
-                    go.Scatter(x=x_vals, y=y_tangent, mode='lines', 
-                             name='Tangent', line=dict(dash='dash', color='red')),
-                    go.Scatter(x=[point], y=[y_point], mode='markers',
-                             marker=dict(size=12, color='red'), name='Point')
+                    {'y': y_tangent},
+                    {'x': [point], 'y': [y0[i]]}
                 ],
+                traces=[1, 2],
                 name=f'{point:.2f}'
             )
             frames.append(frame)
@@ -417,10 +512,17 @@ class InteractivePlots:
         # Initial figure
         fig = go.Figure(
             data=[
-                go.Scatter(x=x_vals, y=y_vals, mode='lines', name='f(x)'),
-                go.Scatter(x=x_vals, y=f(x_range[0]) + df(x_range[0])*(x_vals-x_range[0]),
-                         mode='lines', name='Tangent', line=dict(dash='dash', color='red')),
-                go.Scatter(x=[x_range[0]], y=[f(x_range[0])], mode='markers',
+                # hoverinfo='skip' on the 1000-point line traces keeps
+                # the browser from recomputing unified hover on every
+                # mouse-move; only the marker reports values.  simplify
+                # lets plotly thin line vertices client-side when zoomed
+                # out.
+                go.Scatter(x=x_vals, y=y_vals, mode='lines', name='f(x)',
+                         hoverinfo='skip', line=dict(simplify=True)),
+                go.Scatter(x=x_vals, y=dy[0] * (x_vals - tangent_points[0]) + y0[0],
+                         mode='lines', name='Tangent', hoverinfo='skip',
+                         line=dict(dash='dash', color='red', simplify=True)),
+                go.Scatter(x=[tangent_points[0]], y=[y0[0]], mode='markers',
                          marker=dict(size=12, color='red'), name='Point')
             ],
             frames=frames